@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from services.background_service import background_service
-from services.youtube_service import youtube_client
+from services.youtube_service import get_youtube_client
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,13 +15,13 @@ async def get_system_status():
     """
     try:
         background_status = background_service.get_status()
-        quota_status = youtube_client.get_quota_status()
+        quota_status = get_youtube_client().get_quota_status()
         
         return {
             "background_service": background_status,
             "youtube_api": quota_status,
             "system": {
-                "status": "healthy" if background_status["is_running"] else "stopped"
+                "status": "healthy" if background_status["is_running"] and not background_status["is_paused"] else "stopped"
             }
         }
         
@@ -34,9 +34,11 @@ async def get_system_status():
 async def start_background_fetching():
     """
     Start the background video fetching service
+
+    Resumes fetching on every worker after a stop.
     """
     try:
-        await background_service.start_background_fetching()
+        await background_service.resume_fetching()
         return {"message": "Background fetching started successfully"}
         
     except Exception as e:
@@ -48,9 +50,12 @@ async def start_background_fetching():
 async def stop_background_fetching():
     """
     Stop the background video fetching service
+
+    Pauses fetching on every worker until the service is started again; the
+    worker currently fetching stops within one fetch interval.
     """
     try:
-        await background_service.stop_background_fetching()
+        await background_service.pause_fetching()
         return {"message": "Background fetching stopped successfully"}
         
     except Exception as e:
@@ -91,7 +96,7 @@ async def get_youtube_quota_status():
     Get YouTube API quota status for all configured keys
     """
     try:
-        return youtube_client.get_quota_status()
+        return get_youtube_client().get_quota_status()
         
     except Exception as e:
         logger.error(f"Error getting YouTube quota status: {e}")
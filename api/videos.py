@@ -1,8 +1,9 @@
 from fastapi import APIRouter, Query, HTTPException, Depends
-from typing import Optional
+from typing import Optional, Literal
 from datetime import datetime
-from models.video import VideoResponse, VideoFilter
+from models.video import VideoResponse, VideoFilter, VideoCursor
 from services.video_service import video_service
+from core.responses import MongoJSONResponse
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,36 +15,60 @@ router = APIRouter(prefix="/api/videos", tags=["videos"])
 async def get_videos(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous response's next_cursor"),
+    include_total: bool = Query(False, description="Include total count and total pages (slower)"),
     search: Optional[str] = Query(None, description="Search in title, description, or channel"),
     channel_id: Optional[str] = Query(None, description="Filter by channel ID"),
+    channel_title: Optional[str] = Query(None, description="Filter by channel name prefix (case-insensitive)"),
     published_after: Optional[datetime] = Query(None, description="Filter videos published after this date"),
     published_before: Optional[datetime] = Query(None, description="Filter videos published before this date"),
+    min_duration: Optional[int] = Query(None, ge=0, description="Minimum duration in seconds"),
+    max_duration: Optional[int] = Query(None, ge=0, description="Maximum duration in seconds"),
+    fields: Literal["summary", "full"] = Query("summary", description="Return summary fields or the full document"),
 ):
     """
     Get paginated videos sorted by published datetime (descending)
     
-    - **page**: Page number (starts from 1)
+    - **page**: Page number (starts from 1), ignored when a cursor is given
     - **per_page**: Number of videos per page (max 100)
+    - **cursor**: Continue after the last video of a previous page (preferred over page)
+    - **include_total**: Also count all matching videos
     - **search**: Search term for title, description, or channel name
     - **channel_id**: Filter by specific channel ID
+    - **channel_title**: Filter by channel names starting with this text (case-insensitive)
     - **published_after**: Filter videos published after this date (ISO format)
     - **published_before**: Filter videos published before this date (ISO format)
+    - **min_duration** / **max_duration**: Filter by video length in seconds
+    - **fields**: `summary` omits descriptions and the largest thumbnails, `full` returns everything
     """
+    try:
+        video_cursor = VideoCursor.decode(cursor) if cursor else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
     try:
         filters = VideoFilter(
             search=search,
             channel_id=channel_id,
+            channel_title=channel_title,
             published_after=published_after,
-            published_before=published_before
+            published_before=published_before,
+            min_duration=min_duration,
+            max_duration=max_duration
         )
         
         result = await video_service.get_videos_paginated(
             page=page,
             per_page=per_page,
-            filters=filters
+            filters=filters,
+            cursor=video_cursor,
+            include_total=include_total,
+            full=fields == "full"
         )
         
-        return result
+        # Returning a response directly skips FastAPI re-validating the page
+        # against response_model, which is kept for the OpenAPI schema
+        return MongoJSONResponse(content=result)
         
     except Exception as e:
         logger.error(f"Error getting videos: {e}")
@@ -52,16 +77,21 @@ async def get_videos(
 
 @router.get("/latest")
 async def get_latest_videos(
-    limit: int = Query(10, ge=1, le=50, description="Number of latest videos to return")
+    limit: int = Query(10, ge=1, le=50, description="Number of latest videos to return"),
+    fields: Literal["summary", "full"] = Query("summary", description="Return summary fields or the full document"),
 ):
     """
     Get the latest videos (quick endpoint for recent videos)
     
     - **limit**: Number of latest videos to return (max 50)
+    - **fields**: `summary` omits descriptions and the largest thumbnails, `full` returns everything
     """
     try:
-        videos = await video_service.get_latest_videos(limit=limit)
-        return {"videos": videos, "count": len(videos)}
+        videos = await video_service.get_latest_videos(limit=limit, full=fields == "full")
+        return MongoJSONResponse(content={
+            "videos": videos,
+            "count": len(videos)
+        })
         
     except Exception as e:
         logger.error(f"Error getting latest videos: {e}")
@@ -72,17 +102,22 @@ async def get_latest_videos(
 async def get_video_stats():
     """
     Get basic statistics about stored videos
+    
+    `total_videos` is estimated from collection metadata; `exact_total_videos` is
+    the exact count from the last background fetch, or null if not yet known.
     """
     try:
         total_count = await video_service.get_video_count()
+        exact_count = await video_service.get_exact_video_count()
         latest_videos = await video_service.get_latest_videos(limit=1)
         
         stats = {
             "total_videos": total_count,
+            "exact_total_videos": exact_count,
             "latest_video": latest_videos[0] if latest_videos else None
         }
         
-        return stats
+        return MongoJSONResponse(content=stats)
         
     except Exception as e:
         logger.error(f"Error getting video stats: {e}")
@@ -101,7 +136,7 @@ async def get_video_by_id(video_id: str):
         if not video:
             raise HTTPException(status_code=404, detail="Video not found")
         
-        return video
+        return MongoJSONResponse(content=video.model_dump(by_alias=True))
         
     except HTTPException:
         raise
@@ -0,0 +1,106 @@
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+import redis.asyncio as aioredis
+from core.config import settings
+from core.responses import mongo_json_dumps
+import logging
+
+logger = logging.getLogger(__name__)
+
+CACHE_PREFIX = "v1"
+NAMESPACE_KEY = f"{CACHE_PREFIX}:ns"
+
+# Seconds to wait on Redis before falling back to MongoDB; a Redis that stops
+# answering must not stall requests any more than one that refuses connections
+REDIS_TIMEOUT = 0.5
+
+
+class Cache:
+    client: Optional[aioredis.Redis] = None
+
+
+cache = Cache()
+
+
+async def connect_to_redis():
+    """Create Redis connection, leaving caching disabled if Redis is unreachable"""
+    try:
+        cache.client = aioredis.from_url(
+            settings.redis_url,
+            socket_timeout=REDIS_TIMEOUT,
+            socket_connect_timeout=REDIS_TIMEOUT
+        )
+
+        # Test the connection
+        await cache.client.ping()
+        logger.info("Successfully connected to Redis")
+
+    except Exception as e:
+        logger.warning(f"Redis unavailable, response caching disabled: {e}")
+        cache.client = None
+
+
+async def close_redis_connection():
+    """Close Redis connection"""
+    if cache.client:
+        await cache.client.aclose()
+        cache.client = None
+        logger.info("Disconnected from Redis")
+
+
+def get_redis() -> Optional[aioredis.Redis]:
+    """Get Redis client, or None when caching is disabled"""
+    return cache.client
+
+
+async def _make_cache_key(name: str, params: dict) -> str:
+    """Build a cache key from the current namespace version and a hash of the params"""
+    namespace = await cache.client.get(NAMESPACE_KEY) or b"0"
+    payload = json.dumps({"name": name, **params}, default=str, sort_keys=True)
+    digest = hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+    return f"{CACHE_PREFIX}:{namespace.decode()}:{digest}"
+
+
+async def cache_through(name: str, params: dict, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Read-through cache for JSON-serializable results
+
+    Results are stored exactly as MongoJSONResponse would render them, so a
+    cached value can be returned to a route without rebuilding models.
+    Entries live for one fetch interval, since that is how often new videos
+    can arrive. Redis errors fall back to calling `compute` directly.
+    """
+    if cache.client is None:
+        return await compute()
+
+    try:
+        key = await _make_cache_key(name, params)
+        cached = await cache.client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+    except Exception as e:
+        logger.warning(f"Error reading from cache: {e}")
+        return await compute()
+
+    result = await compute()
+
+    try:
+        await cache.client.set(key, mongo_json_dumps(result), ex=settings.fetch_interval)
+    except Exception as e:
+        logger.warning(f"Error writing to cache: {e}")
+
+    return result
+
+
+async def invalidate_cache():
+    """Invalidate all cached entries by bumping the namespace version"""
+    if cache.client is None:
+        return
+
+    try:
+        await cache.client.incr(NAMESPACE_KEY)
+    except Exception as e:
+        logger.warning(f"Error invalidating cache: {e}")
@@ -1,19 +1,37 @@
 import os
-from typing import List
+from functools import cached_property
+from typing import List, Tuple, Union, Annotated
 from pydantic_settings import BaseSettings
-from pydantic import Field, field_validator
+from pydantic import Field, BeforeValidator
+
+
+def _split_api_keys(value):
+    """Split a comma-separated string of API keys into a list"""
+    if isinstance(value, str):
+        return [key.strip() for key in value.split(",") if key.strip()]
+    return value or []
+
+
+# str stays in the union so pydantic-settings accepts a plain comma-separated
+# env value instead of requiring a JSON list
+ApiKeys = Annotated[Union[List[str], str], BeforeValidator(_split_api_keys)]
 
 
 class Settings(BaseSettings):
     # YouTube API Configuration
-    youtube_api_keys: str = ""
+    youtube_api_keys: ApiKeys = []
     search_query: str = "python programming"
     fetch_interval: int = 10
     max_results_per_request: int = 50
+    max_concurrent_api_requests: int = 8
+    video_cache_dir: str = ".cache/youtube_videos"
     
     # MongoDB Configuration
     mongodb_url: str = "mongodb://localhost:27017"
     database_name: str = "youtube_videos"
+    mongodb_min_pool_size: int = 10
+    mongodb_max_pool_size: int = 50
+    mongodb_compressors: str = "zstd,zlib"
     
     # Redis Configuration
     redis_url: str = "redis://localhost:6379"
@@ -21,6 +39,7 @@ class Settings(BaseSettings):
     # Application Configuration
     app_host: str = "0.0.0.0"
     app_port: int = 8000
+    app_workers: int = 0  # 0 picks half the CPU count (at least 2); ignored in debug mode
     debug: bool = True
     
     # Security
@@ -31,18 +50,14 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
     
-    @field_validator('youtube_api_keys')
-    @classmethod
-    def parse_api_keys(cls, v):
-        if isinstance(v, str):
-            return [key.strip() for key in v.split(",") if key.strip()]
-        return v or []
+    @cached_property
+    def api_keys(self) -> Tuple[str, ...]:
+        """API keys parsed once at startup"""
+        return tuple(self.youtube_api_keys)
     
     def get_api_keys(self) -> List[str]:
         """Get parsed API keys as a list"""
-        if isinstance(self.youtube_api_keys, str):
-            return [key.strip() for key in self.youtube_api_keys.split(",") if key.strip()]
-        return self.youtube_api_keys or []
+        return self.youtube_api_keys
 
 
 settings = Settings()
@@ -1,23 +1,53 @@
 import motor.motor_asyncio
+from datetime import datetime, timedelta
+from typing import Optional
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo.errors import OperationFailure
 from core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Indexes from earlier schema versions that have since been superseded
+OBSOLETE_INDEXES = [
+    "published_at_-1",  # replaced by (published_at, _id)
+    "title_1",  # replaced by the text index
+    "channel_id_1",  # prefix of (channel_id, published_at, _id)
+    "published_at_-1_channel_id_1",  # wrong column order for channel feeds
+    "created_at_-1",  # not used by any query
+]
+
+# Partial index over recently published videos, serving the latest-videos feed
+RECENT_FEED_INDEX = "recent_feed_idx"
+RECENT_FEED_WINDOW = timedelta(days=90)
+RECENT_FEED_MAX_AGE = timedelta(days=30)  # rebuild once the cutoff is this stale
+
 
 class Database:
     client: AsyncIOMotorClient = None
     database: AsyncIOMotorDatabase = None
+    recent_feed_cutoff: Optional[datetime] = None
 
 
 db = Database()
 
 
 async def connect_to_mongo():
-    """Create database connection"""
+    """
+    Create database connection
+
+    Called from the app lifespan so each worker process owns one client and pool.
+    """
     try:
-        db.client = AsyncIOMotorClient(settings.mongodb_url)
+        db.client = AsyncIOMotorClient(
+            settings.mongodb_url,
+            minPoolSize=settings.mongodb_min_pool_size,
+            maxPoolSize=settings.mongodb_max_pool_size,
+            maxIdleTimeMS=60000,
+            serverSelectionTimeoutMS=3000,
+            compressors=settings.mongodb_compressors,
+            retryWrites=True
+        )
         db.database = db.client[settings.database_name]
         
         # Test the connection
@@ -46,24 +76,100 @@ async def create_indexes():
         
         # Create indexes
         await videos_collection.create_index("video_id", unique=True)
-        await videos_collection.create_index([("published_at", -1)])  # Descending order for latest first
-        await videos_collection.create_index("channel_id")
-        await videos_collection.create_index("title")
+        await videos_collection.create_index([("published_at", -1), ("_id", -1)])  # Latest first, keyset pagination
         await videos_collection.create_index("tags")
-        await videos_collection.create_index([("created_at", -1)])
+        await videos_collection.create_index("duration_seconds")
+        
+        # Full-text search over title, description and channel name
+        await videos_collection.create_index(
+            [("title", "text"), ("description", "text"), ("channel_title", "text")],
+            weights={"title": 10, "channel_title": 5, "description": 1},
+            name="video_text_search"
+        )
+        
+        # Case-insensitive channel name lookups and prefix matches
+        await videos_collection.create_index(
+            [("channel_title", 1)],
+            collation={"locale": "en", "strength": 2},
+            name="channel_title_ci"
+        )
         
-        # Compound indexes for common queries
+        # Compound indexes for common queries: filter by channel, newest first
         await videos_collection.create_index([
+            ("channel_id", 1),
             ("published_at", -1),
-            ("channel_id", 1)
+            ("_id", -1)
         ])
         
+        # Every worker runs this at startup; a stale index is left for the
+        # background fetcher leader to rebuild
+        await ensure_recent_feed_index(rebuild_stale=False)
+        
+        # Drop indexes superseded by the ones above
+        existing_indexes = await videos_collection.index_information()
+        for index_name in OBSOLETE_INDEXES:
+            if index_name in existing_indexes:
+                await videos_collection.drop_index(index_name)
+                logger.info(f"Dropped obsolete index {index_name}")
+        
         logger.info("Database indexes created successfully")
         
     except Exception as e:
         logger.error(f"Failed to create indexes: {e}")
 
 
+async def ensure_recent_feed_index(rebuild_stale: bool = True):
+    """
+    Create the partial index over recent videos, rebuilding it once its cutoff is stale
+
+    Queries only use the index when they filter on published_at > cutoff, so the
+    current cutoff is kept on `db.recent_feed_cutoff` for them to use. Only the
+    background fetcher leader rebuilds a stale index; other callers pass
+    `rebuild_stale=False` and just adopt the existing cutoff.
+    """
+    videos_collection = db.database.videos
+    now = datetime.utcnow()
+    
+    try:
+        existing_index = (await videos_collection.index_information()).get(RECENT_FEED_INDEX)
+        if existing_index:
+            cutoff = existing_index["partialFilterExpression"]["published_at"]["$gt"]
+            if not rebuild_stale or now - cutoff < RECENT_FEED_WINDOW + RECENT_FEED_MAX_AGE:
+                db.recent_feed_cutoff = cutoff
+                return
+            
+            # Stop queries from targeting the index while it is rebuilt
+            db.recent_feed_cutoff = None
+            await videos_collection.drop_index(RECENT_FEED_INDEX)
+        
+        cutoff = now - RECENT_FEED_WINDOW
+        await videos_collection.create_index(
+            [("published_at", -1), ("_id", -1)],
+            partialFilterExpression={"published_at": {"$gt": cutoff}},
+            name=RECENT_FEED_INDEX
+        )
+        
+    except OperationFailure as e:
+        # Another process dropped or built the index at the same time; use theirs
+        logger.info(f"{RECENT_FEED_INDEX} changed concurrently, reloading its cutoff: {e}")
+        await refresh_recent_feed_cutoff()
+        return
+    
+    db.recent_feed_cutoff = cutoff
+    logger.info(f"Built {RECENT_FEED_INDEX} for videos published after {cutoff.isoformat()}")
+
+
+async def refresh_recent_feed_cutoff():
+    """Reload `db.recent_feed_cutoff` from the recent videos index without changing it"""
+    existing_index = (await db.database.videos.index_information()).get(RECENT_FEED_INDEX)
+    db.recent_feed_cutoff = existing_index["partialFilterExpression"]["published_at"]["$gt"] if existing_index else None
+
+
+def get_recent_feed_cutoff() -> Optional[datetime]:
+    """Get the published_at cutoff of the recent videos index, if it exists"""
+    return db.recent_feed_cutoff
+
+
 def get_database() -> AsyncIOMotorDatabase:
     """Get database instance"""
     return db.database
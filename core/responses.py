@@ -0,0 +1,38 @@
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import ORJSONResponse
+
+
+def _orjson_default(value: Any) -> Any:
+    """Serialize BSON types orjson does not handle natively"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def mongo_json_dumps(content: Any) -> bytes:
+    """
+    Serialize content, including raw MongoDB documents, to JSON
+
+    Datetimes are serialized natively by orjson; naive values are stored as
+    UTC, so they are written as RFC 3339 with a `Z` suffix.
+    """
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=(
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NAIVE_UTC
+            | orjson.OPT_UTC_Z
+        )
+    )
+
+
+class MongoJSONResponse(ORJSONResponse):
+    """orjson response that also accepts raw MongoDB documents"""
+
+    def render(self, content: Any) -> bytes:
+        return mongo_json_dumps(content)
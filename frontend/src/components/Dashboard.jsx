@@ -49,6 +49,8 @@ const Dashboard = () => {
       const params = {
         page,
         per_page: perPage,
+        include_total: true,
+        fields: 'full',
       };
       
       if (searchTerm) params.search = searchTerm;
@@ -171,11 +173,11 @@ const Dashboard = () => {
                 <div className="flex items-center space-x-2">
                   <Activity 
                     className={`h-5 w-5 ${
-                      systemStatus.background_service.is_running ? 'text-green-500' : 'text-red-500'
+                      (systemStatus.background_service.is_running && !systemStatus.background_service.is_paused) ? 'text-green-500' : 'text-red-500'
                     }`} 
                   />
                   <span className="text-sm text-gray-600">
-                    {systemStatus.background_service.is_running ? 'Active' : 'Stopped'}
+                    {(systemStatus.background_service.is_running && !systemStatus.background_service.is_paused) ? 'Active' : 'Stopped'}
                   </span>
                 </div>
               )}
@@ -221,7 +223,7 @@ const Dashboard = () => {
                   <span>Force Fetch</span>
                 </button>
                 
-                {systemStatus?.background_service.is_running ? (
+                {(systemStatus?.background_service.is_running && !systemStatus?.background_service.is_paused) ? (
                   <button
                     onClick={handleStopFetching}
                     className="px-3 py-2 bg-red-600 text-white rounded-md hover:bg-red-700 flex items-center space-x-1"
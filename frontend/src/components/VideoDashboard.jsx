@@ -33,6 +33,8 @@ const VideoDashboard = () => {
       const queryParams = new URLSearchParams({
         page,
         per_page: VIDEOS_PER_PAGE,
+        include_total: true,
+        fields: 'full',
         sort: sortBy,
       });
 
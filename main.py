@@ -6,10 +6,14 @@ import logging
 import os
 
 from core.config import settings
-from core.database import connect_to_mongo, close_mongo_connection
+from core.database import connect_to_mongo, close_mongo_connection, get_database
+from core.cache import connect_to_redis, close_redis_connection
+from core.responses import MongoJSONResponse
 from api.videos import router as videos_router
 from api.admin import router as admin_router
 from services.background_service import background_service
+from services.video_service import video_service
+from services.youtube_service import close_youtube_client
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +33,10 @@ async def lifespan(app: FastAPI):
         # Connect to MongoDB
         await connect_to_mongo()
         logger.info("Connected to MongoDB")
+        video_service.bind(get_database())
+        
+        # Connect to Redis (optional, used for response caching)
+        await connect_to_redis()
         
         # Start background video fetching
         await background_service.start_background_fetching()
@@ -52,6 +60,12 @@ async def lifespan(app: FastAPI):
         await close_mongo_connection()
         logger.info("Closed MongoDB connection")
         
+        # Close Redis connection
+        await close_redis_connection()
+        
+        # Close pooled connections to the YouTube API
+        await close_youtube_client()
+        
     except Exception as e:
         logger.error(f"Error during shutdown: {e}")
 
@@ -61,6 +75,7 @@ app = FastAPI(
     title="YouTube Video Fetcher API",
     description="API for fetching and storing YouTube videos with background processing",
     version="1.0.0",
+    default_response_class=MongoJSONResponse,
     lifespan=lifespan
 )
 
@@ -121,11 +136,21 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    # Every uvicorn worker is a separate process that runs the lifespan above,
+    # so each one opens its own MongoDB client and connection pool. Only one
+    # of them, elected through a lock, runs the background fetcher. Reload
+    # mode only supports a single worker. loop="auto" picks uvloop where it is
+    # installed (it does not support Windows) and asyncio otherwise.
     import uvicorn
+    workers = settings.app_workers or max(2, (os.cpu_count() or 1) // 2)
     uvicorn.run(
         "main:app",
         host=settings.app_host,
         port=settings.app_port,
-        reload=settings.debug
+        reload=settings.debug,
+        workers=1 if settings.debug else workers,
+        loop="auto",
+        http="httptools",
+        access_log=settings.debug,
+        log_level="info" if settings.debug else "warning"
     )
-
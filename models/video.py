@@ -1,5 +1,8 @@
+import base64
+import json
+from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Optional, List, Any, Annotated
+from typing import Optional, List, Dict, Any, Annotated
 from pydantic import BaseModel, Field, ConfigDict, BeforeValidator
 from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import core_schema
@@ -51,6 +54,8 @@ class VideoThumbnail(BaseModel):
 
 
 class VideoThumbnails(BaseModel):
+    """Thumbnail set as returned by the YouTube API; its fields are the sizes kept on ingest"""
+
     default: Optional[VideoThumbnail] = None
     medium: Optional[VideoThumbnail] = None
     high: Optional[VideoThumbnail] = None
@@ -58,22 +63,47 @@ class VideoThumbnails(BaseModel):
     maxres: Optional[VideoThumbnail] = None
 
 
+@dataclass(slots=True)
+class VideoRecord:
+    """A video as parsed from the YouTube API, before it is stored"""
+
+    video_id: str
+    title: str
+    description: str
+    published_at: datetime
+    channel_id: str
+    channel_title: str
+    thumbnails: Dict[str, Dict[str, Any]]
+    duration: Optional[str]
+    duration_seconds: Optional[int]
+    view_count: int
+    like_count: int
+    comment_count: int
+    tags: List[str]
+    category_id: Optional[str]
+    language: Optional[str]
+
+    def asdict(self) -> Dict[str, Any]:
+        """Fields as a dict, ready to be written to MongoDB"""
+        return asdict(self)
+
+
 class VideoModel(BaseModel):
     model_config = ConfigDict(
         populate_by_name=True,
-        arbitrary_types_allowed=True,
-        json_encoders={ObjectId: str, PyObjectId: str}
+        arbitrary_types_allowed=True
     )
     
     id: Optional[PyObjectId] = Field(default=None, alias="_id")
     video_id: str = Field(..., description="YouTube video ID")
     title: str = Field(..., description="Video title")
-    description: str = Field(..., description="Video description")
+    description: Optional[str] = Field(None, description="Video description")
     published_at: datetime = Field(..., description="Video publish datetime")
     channel_id: str = Field(..., description="Channel ID")
     channel_title: str = Field(..., description="Channel title")
-    thumbnails: VideoThumbnails = Field(..., description="Video thumbnails")
+    thumbnails: Dict[str, Dict[str, Any]] = Field(..., description="Video thumbnail url, width and height by quality, copied from the YouTube API without validation")
     duration: Optional[str] = Field(None, description="Video duration")
+    duration_seconds: Optional[int] = Field(None, description="Video duration in seconds")
     view_count: Optional[int] = Field(None, description="View count")
     like_count: Optional[int] = Field(None, description="Like count")
     comment_count: Optional[int] = Field(None, description="Comment count")
@@ -83,13 +113,43 @@ class VideoModel(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow, description="Record creation time")
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="Record update time")
 
+    @classmethod
+    def from_document(cls, document: dict) -> "VideoModel":
+        """Build a model from a trusted database document without re-validating it"""
+        return cls.model_construct(**{**document, "_id": str(document["_id"])})
+
+
+class VideoCursor(BaseModel):
+    """Keyset pagination cursor pointing at the last video of a page"""
+    model_config = ConfigDict(populate_by_name=True)
+
+    published_at: datetime
+    id: PyObjectId = Field(..., alias="_id")
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque base64url token"""
+        payload = json.dumps({"published_at": self.published_at.isoformat(), "_id": str(self.id)})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "VideoCursor":
+        """Decode a token produced by `encode`, raising ValueError if it is malformed"""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return cls(**payload)
+        except Exception as e:
+            raise ValueError("Invalid cursor") from e
+
 
 class VideoResponse(BaseModel):
     videos: List[VideoModel]
-    total: int
     page: int
     per_page: int
-    total_pages: int
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total: Optional[int] = None
+    total_pages: Optional[int] = None
 
 
 class VideoFilter(BaseModel):
@@ -98,5 +158,5 @@ class VideoFilter(BaseModel):
     channel_title: Optional[str] = None  # Add channel title filter
     published_after: Optional[datetime] = None
     published_before: Optional[datetime] = None
-    min_duration: Optional[int] = None
-    max_duration: Optional[int] = None
\ No newline at end of file
+    min_duration: Optional[int] = None  # seconds
+    max_duration: Optional[int] = None  # seconds
\ No newline at end of file
@@ -1,21 +1,68 @@
 import asyncio
 import logging
+import os
+import tempfile
+import time
 from datetime import datetime, timedelta
-from typing import Optional
-from services.youtube_service import youtube_client
+from typing import Optional, List, Set
+from redis.exceptions import LockError
+from services.youtube_service import get_youtube_client
 from services.video_service import video_service
+from models.video import VideoRecord
 from core.config import settings
+from core.cache import invalidate_cache, get_redis
+from core.database import ensure_recent_feed_index, refresh_recent_feed_cutoff
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    import msvcrt
+    fcntl = None
 
 logger = logging.getLogger(__name__)
 
+# How often the leader checks whether the recent videos index needs rebuilding,
+# and other workers pick up the cutoff of an index the leader rebuilt
+INDEX_MAINTENANCE_INTERVAL = 60 * 60
+
+# Every worker process runs the lifespan, but only the holder of this lock
+# fetches. The leader renews it each loop, so it must outlive one iteration
+# (a rate-limit backoff included); if the leader dies another worker takes over.
+FETCHER_LOCK_KEY = "fetcher:leader"
+FETCHER_LOCK_TTL = max(3 * settings.fetch_interval, 120)
+
+# Set through the admin API to stop fetching on every worker, not just the one
+# that answered the request
+FETCHER_PAUSED_KEY = "fetcher:paused"
+
+# Without Redis, an exclusive lock on this file elects one fetcher per host,
+# and the pause file next to it stands in for FETCHER_PAUSED_KEY
+FETCHER_LOCK_FILE = os.path.join(tempfile.gettempdir(), f"youtube-fetcher-{settings.database_name}.lock")
+FETCHER_PAUSE_FILE = f"{FETCHER_LOCK_FILE}.paused"
+
 
 class BackgroundTaskService:
     def __init__(self):
         self.is_running = False
         self.task: Optional[asyncio.Task] = None
+        self.maintenance_task: Optional[asyncio.Task] = None
         self.last_fetch_time: Optional[datetime] = None
         self.fetch_count = 0
         self.error_count = 0
+        # Stores run alongside the next fetch; bound how many hit MongoDB at once
+        self._store_semaphore = asyncio.Semaphore(4)
+        self._store_tasks: Set[asyncio.Task] = set()
+        # Manual fetch currently running, shared by concurrent force_fetch callers
+        self._force_fetch_task: Optional[asyncio.Task] = None
+        # Whether this process is the one running the fetcher
+        self.is_leader = False
+        # Whether fetching is paused on every worker
+        self.is_paused = False
+        self._leader_lock = None
+        # Monotonic time at which the Redis lock last taken or renewed runs out
+        self._leader_lock_expires_at = 0.0
+        self._lock_file = None
 
     async def start_background_fetching(self):
         """Start the background video fetching task"""
@@ -25,6 +72,7 @@ class BackgroundTaskService:
         
         self.is_running = True
         self.task = asyncio.create_task(self._fetch_videos_loop())
+        self.maintenance_task = asyncio.create_task(self._maintain_indexes_loop())
         logger.info("Started background video fetching")
 
     async def stop_background_fetching(self):
@@ -34,14 +82,55 @@ class BackgroundTaskService:
             return
         
         self.is_running = False
-        if self.task:
-            self.task.cancel()
+        for task in (self.task, self.maintenance_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        
+        # Let stores that are already in flight finish
+        if self._store_tasks:
+            await asyncio.gather(*self._store_tasks, return_exceptions=True)
+        
+        # Hand the fetcher over to another worker straight away
+        await self._release_leadership()
+        
+        logger.info("Stopped background video fetching")
+
+    async def pause_fetching(self):
+        """
+        Pause fetching on every worker
+
+        Each worker's loop keeps running but stops fetching, and the leader
+        hands back its lock, until resume_fetching is called on any worker.
+        """
+        redis = get_redis()
+        if redis is None:
+            open(FETCHER_PAUSE_FILE, "w").close()
+        else:
+            await redis.set(FETCHER_PAUSED_KEY, 1)
+        
+        self.is_paused = True
+        await self._release_leadership()
+        logger.info("Paused background video fetching on all workers")
+
+    async def resume_fetching(self):
+        """Resume fetching on every worker, starting this worker's loop if it was stopped"""
+        redis = get_redis()
+        if redis is None:
             try:
-                await self.task
-            except asyncio.CancelledError:
+                os.remove(FETCHER_PAUSE_FILE)
+            except FileNotFoundError:
                 pass
+        else:
+            await redis.delete(FETCHER_PAUSED_KEY)
         
-        logger.info("Stopped background video fetching")
+        self.is_paused = False
+        if not self.is_running:
+            await self.start_background_fetching()
+        logger.info("Resumed background video fetching on all workers")
 
     async def _fetch_videos_loop(self):
         """Main loop for fetching videos"""
@@ -49,10 +138,21 @@ class BackgroundTaskService:
         
         while self.is_running:
             try:
-                await self._fetch_and_store_videos()
+                if not await self._update_leadership():
+                    # Another process is fetching; check again in case it stops
+                    await asyncio.sleep(settings.fetch_interval)
+                    continue
+                
+                videos = await self._fetch_videos()
                 self.fetch_count += 1
                 self.last_fetch_time = datetime.utcnow()
                 
+                # Store in the background so the write overlaps the next fetch
+                if videos:
+                    store_task = asyncio.create_task(self._store_videos(videos))
+                    self._store_tasks.add(store_task)
+                    store_task.add_done_callback(self._on_store_done)
+                
                 # Wait for the specified interval
                 await asyncio.sleep(settings.fetch_interval)
                 
@@ -65,8 +165,125 @@ class BackgroundTaskService:
                 # Wait a bit longer on error to avoid rapid retries
                 await asyncio.sleep(min(settings.fetch_interval * 2, 60))
 
+    async def _maintain_indexes_loop(self):
+        """Periodically roll the recent videos index forward, or follow the leader's rebuild"""
+        while self.is_running:
+            try:
+                await asyncio.sleep(INDEX_MAINTENANCE_INTERVAL)
+                if self.is_leader:
+                    await ensure_recent_feed_index()
+                else:
+                    await refresh_recent_feed_cutoff()
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error maintaining indexes: {e}")
+
+    async def _update_leadership(self) -> bool:
+        """Take or renew the fetcher lock, returning whether this process should fetch"""
+        was_leader = self.is_leader
+        self.is_paused = await self._check_paused()
+        if self.is_paused:
+            await self._release_leadership()
+        else:
+            self.is_leader = await self._acquire_leadership()
+        
+        if self.is_leader != was_leader:
+            logger.info(f"Process {os.getpid()} {'is now' if self.is_leader else 'is no longer'} the background fetcher")
+        return self.is_leader
+
+    async def _check_paused(self) -> bool:
+        """Whether fetching has been paused for every worker"""
+        redis = get_redis()
+        if redis is None:
+            return os.path.exists(FETCHER_PAUSE_FILE)
+        
+        try:
+            return bool(await redis.exists(FETCHER_PAUSED_KEY))
+        except Exception as e:
+            logger.warning(f"Error reading fetcher pause flag from Redis, keeping previous state: {e}")
+            return self.is_paused
+
+    async def _acquire_leadership(self) -> bool:
+        """
+        Hold the Redis fetcher lock, falling back to the local lock file without Redis
+
+        The two mechanisms are never mixed: with Redis connected, a failed Redis
+        call keeps the current role only while a lock this process took is still
+        unexpired, so a slow call cannot start a second fetcher.
+        """
+        redis = get_redis()
+        if redis is None:
+            return self._acquire_local_lock()
+        
+        try:
+            if self._leader_lock is None:
+                self._leader_lock = redis.lock(FETCHER_LOCK_KEY, timeout=FETCHER_LOCK_TTL)
+            renewed_at = time.monotonic()
+            if await self._leader_lock.owned():
+                await self._leader_lock.reacquire()
+                acquired = True
+            else:
+                acquired = await self._leader_lock.acquire(blocking=False)
+            if acquired:
+                self._leader_lock_expires_at = renewed_at + FETCHER_LOCK_TTL
+            return acquired
+            
+        except LockError:
+            # The lock expired and another process took it
+            return False
+        except Exception as e:
+            still_owned = self.is_leader and time.monotonic() < self._leader_lock_expires_at
+            logger.warning(f"Error renewing fetcher lock in Redis, {'keeping' if still_owned else 'not taking'} leadership: {e}")
+            return still_owned
+
+    def _acquire_local_lock(self) -> bool:
+        """Hold an exclusive lock on FETCHER_LOCK_FILE, kept until this process stops"""
+        if self._lock_file is None:
+            lock_file = open(FETCHER_LOCK_FILE, "w")
+            try:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            except OSError:
+                lock_file.close()
+                return False
+            self._lock_file = lock_file
+        return True
+
+    async def _release_leadership(self):
+        """Give up the fetcher locks held by this process"""
+        if self._leader_lock is not None:
+            try:
+                await self._leader_lock.release()
+            except Exception:
+                pass
+            self._leader_lock = None
+            self._leader_lock_expires_at = 0.0
+        
+        if self._lock_file is not None:
+            # Closing the file releases the lock
+            self._lock_file.close()
+            self._lock_file = None
+        
+        self.is_leader = False
+
+    def _on_store_done(self, task: asyncio.Task):
+        """Record the outcome of a background store task"""
+        self._store_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            self.error_count += 1
+
     async def _fetch_and_store_videos(self):
         """Fetch videos from YouTube and store them in database"""
+        videos = await self._fetch_videos()
+        if videos:
+            await self._store_videos(videos)
+
+    async def _fetch_videos(self) -> List[VideoRecord]:
+        """Fetch recent videos for the configured search query from YouTube"""
         try:
             # Calculate the time window for fetching new videos
             # Fetch videos published in the last hour to ensure we don't miss any
@@ -75,48 +292,55 @@ class BackgroundTaskService:
             logger.info(f"Fetching videos for query: '{settings.search_query}'")
             
             # Fetch videos from YouTube
-            videos = await youtube_client.search_videos(
+            videos = await get_youtube_client().search_videos(
                 query=settings.search_query,
                 max_results=settings.max_results_per_request,
                 published_after=published_after,
-                order="date"
+                order="date",
+                # The window moves every cycle, so the search never repeats
+                use_cache=False
             )
             
             if not videos:
                 logger.info("No new videos found")
-                return
             
-            # Store videos in database
-            stored_count = 0
-            updated_count = 0
-            
-            for video_data in videos:
-                try:
-                    existing_video = await video_service.get_video_by_id(video_data['video_id'])
-                    
-                    if existing_video:
-                        # Update existing video with latest data
-                        await video_service.update_video(video_data['video_id'], video_data)
-                        updated_count += 1
-                    else:
-                        # Store new video
-                        await video_service.create_video(video_data)
-                        stored_count += 1
-                        
-                except Exception as e:
-                    logger.error(f"Error storing video {video_data.get('video_id', 'unknown')}: {e}")
-            
-            logger.info(f"Processed {len(videos)} videos: {stored_count} new, {updated_count} updated")
+            return videos
             
         except Exception as e:
-            logger.error(f"Error fetching and storing videos: {e}")
+            logger.error(f"Error fetching videos: {e}")
             raise
 
+    async def _store_videos(self, videos: List[VideoRecord]):
+        """Store fetched videos in database"""
+        async with self._store_semaphore:
+            try:
+                stored_count, updated_count = await video_service.bulk_upsert_videos(videos)
+                await invalidate_cache()
+                
+                # Keep the exact count used by /api/videos/stats out of the request path
+                await video_service.refresh_exact_video_count()
+                
+                logger.info(f"Processed {len(videos)} videos: {stored_count} new, {updated_count} updated")
+                
+            except Exception as e:
+                logger.error(f"Error storing videos: {e}")
+                raise
+
     async def force_fetch(self) -> dict:
-        """Force an immediate fetch (for testing/manual trigger)"""
+        """
+        Force an immediate fetch (for testing/manual trigger)
+
+        Callers arriving while a manual fetch is running wait for that fetch
+        instead of starting another one and spending more API quota.
+        """
         try:
             start_time = datetime.utcnow()
-            await self._fetch_and_store_videos()
+            
+            if self._force_fetch_task is None or self._force_fetch_task.done():
+                self._force_fetch_task = asyncio.create_task(self._fetch_and_store_videos())
+            
+            # Shield so one caller disconnecting does not cancel the shared fetch
+            await asyncio.shield(self._force_fetch_task)
             end_time = datetime.utcnow()
             
             return {
@@ -137,6 +361,8 @@ class BackgroundTaskService:
         """Get current status of background fetching"""
         return {
             "is_running": self.is_running,
+            "is_leader": self.is_leader,
+            "is_paused": self.is_paused,
             "last_fetch_time": self.last_fetch_time.isoformat() if self.last_fetch_time else None,
             "fetch_count": self.fetch_count,
             "error_count": self.error_count,
@@ -1,31 +1,92 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
+import re
 from motor.motor_asyncio import AsyncIOMotorDatabase
-from pymongo import DESCENDING
-from models.video import VideoModel, VideoFilter, VideoResponse
-from core.database import get_database
+from pymongo import DESCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+from models.video import VideoModel, VideoFilter, VideoResponse, VideoCursor, VideoRecord
+from core.database import get_recent_feed_cutoff
+from core.cache import cache_through, get_redis
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Fields left out of list responses unless the full document is requested
+SUMMARY_PROJECTION = {"description": 0, "thumbnails.standard": 0, "thumbnails.maxres": 0}
+
+# Case-insensitive collation matching the channel_title index
+CHANNEL_TITLE_COLLATION = {"locale": "en", "strength": 2}
+
+# Redis key holding the exact video count computed by the background fetcher
+EXACT_COUNT_KEY = "stats:exact_count"
+EXACT_COUNT_TTL = 300
+
+
+def _query_collation(filters: Optional[VideoFilter]) -> Optional[dict]:
+    """Collation a filtered query must run with to use the channel_title index"""
+    if filters and filters.channel_title and not filters.search:
+        return CHANNEL_TITLE_COLLATION
+    return None
+
+
+def _build_query(filters: Optional[VideoFilter]) -> dict:
+    """Translate video filters into a MongoDB query"""
+    if not filters:
+        return {}
+    
+    query = {}
+    
+    if filters.search:
+        # Served by the text index over title, description and channel_title
+        query["$text"] = {"$search": filters.search}
+    
+    if filters.channel_id:
+        query["channel_id"] = filters.channel_id
+    
+    if filters.channel_title:
+        if _query_collation(filters):
+            # Case-insensitive prefix range on the collated index; U+FFFF sorts
+            # after every other character, closing the range
+            query["channel_title"] = {"$gte": filters.channel_title, "$lte": filters.channel_title + "\uffff"}
+        else:
+            # Text search cannot run with a collation, so post-filter its matches
+            query["channel_title"] = {"$regex": f"^{re.escape(filters.channel_title)}", "$options": "i"}
+    
+    date_query = {
+        operator: value
+        for operator, value in (("$gte", filters.published_after), ("$lte", filters.published_before))
+        if value
+    }
+    if date_query:
+        query["published_at"] = date_query
+    
+    duration_query = {
+        operator: value
+        for operator, value in (("$gte", filters.min_duration), ("$lte", filters.max_duration))
+        if value is not None
+    }
+    if duration_query:
+        query["duration_seconds"] = duration_query
+    
+    return query
+
 
 class VideoService:
     def __init__(self):
         self.db: Optional[AsyncIOMotorDatabase] = None
         self.collection = None
 
-    def _ensure_connection(self):
-        """Ensure database connection is available"""
-        if self.db is None:
-            self.db = get_database()
-            self.collection = self.db.videos
+    def bind(self, database: AsyncIOMotorDatabase):
+        """Bind the service to a connected database (called once at startup)"""
+        self.db = database
+        self.collection = database.videos
 
     async def create_video(self, video_data: dict) -> VideoModel:
         """Create a new video record"""
-        self._ensure_connection()
         try:
-            video_data["created_at"] = datetime.utcnow()
-            video_data["updated_at"] = datetime.utcnow()
+            now = datetime.utcnow()
+            video_data["created_at"] = now
+            video_data["updated_at"] = now
             
             result = await self.collection.insert_one(video_data)
             video_data["_id"] = result.inserted_id
@@ -37,11 +98,10 @@ class VideoService:
 
     async def get_video_by_id(self, video_id: str) -> Optional[VideoModel]:
         """Get video by YouTube video ID"""
-        self._ensure_connection()
         try:
             video_data = await self.collection.find_one({"video_id": video_id})
             if video_data:
-                return VideoModel(**video_data)
+                return VideoModel.from_document(video_data)
             return None
         except Exception as e:
             logger.error(f"Error getting video by ID: {e}")
@@ -49,7 +109,6 @@ class VideoService:
 
     async def update_video(self, video_id: str, update_data: dict) -> Optional[VideoModel]:
         """Update video record"""
-        self._ensure_connection()
         try:
             update_data["updated_at"] = datetime.utcnow()
             
@@ -68,7 +127,6 @@ class VideoService:
 
     async def upsert_video(self, video_data: dict) -> VideoModel:
         """Insert or update video record"""
-        self._ensure_connection()
         try:
             video_id = video_data.get("video_id")
             existing_video = await self.get_video_by_id(video_id)
@@ -84,80 +142,161 @@ class VideoService:
             logger.error(f"Error upserting video: {e}")
             raise
 
+    async def bulk_upsert_videos(self, videos: List[VideoRecord]) -> Tuple[int, int]:
+        """
+        Insert or update many video records in a single round-trip
+
+        Returns a tuple of (inserted_count, updated_count).
+        """
+        try:
+            now = datetime.utcnow()
+            operations = [
+                UpdateOne(
+                    {"video_id": video.video_id},
+                    {
+                        "$set": {**video.asdict(), "updated_at": now},
+                        "$setOnInsert": {"created_at": now}
+                    },
+                    upsert=True
+                )
+                for video in videos
+            ]
+            
+            result = await self.collection.bulk_write(operations, ordered=False)
+            return result.upserted_count, result.matched_count
+        except BulkWriteError as e:
+            # Unordered writes keep going past failures; report what was stored
+            for error in e.details.get("writeErrors", []):
+                logger.error(f"Error storing video at index {error.get('index')}: {error.get('errmsg')}")
+            return e.details.get("nUpserted", 0), e.details.get("nMatched", 0)
+        except Exception as e:
+            logger.error(f"Error bulk upserting videos: {e}")
+            raise
+
     async def get_videos_paginated(
         self,
         page: int = 1,
         per_page: int = 20,
-        filters: Optional[VideoFilter] = None
-    ) -> VideoResponse:
-        """Get paginated videos with optional filters"""
-        self._ensure_connection()
+        filters: Optional[VideoFilter] = None,
+        cursor: Optional[VideoCursor] = None,
+        include_total: bool = False,
+        full: bool = False
+    ) -> dict:
+        """
+        Get paginated videos with optional filters, as a JSON-ready VideoResponse dict
+
+        When a cursor is given the page is read with a keyset range scan on the
+        (published_at, _id) index; otherwise falls back to offset pagination by page.
+        Descriptions and the largest thumbnails are left out unless `full` is set.
+        """
         try:
-            # Build query
-            query = {}
-            
-            if filters:
-                if filters.search:
-                    query["$or"] = [
-                        {"title": {"$regex": filters.search, "$options": "i"}},
-                        {"description": {"$regex": filters.search, "$options": "i"}},
-                        {"channel_title": {"$regex": filters.search, "$options": "i"}}
-                    ]
-                
-                if filters.channel_id:
-                    query["channel_id"] = filters.channel_id
-                
-                if filters.channel_title:
-                    query["channel_title"] = {"$regex": filters.channel_title, "$options": "i"}
-                
-                if filters.published_after or filters.published_before:
-                    date_query = {}
-                    if filters.published_after:
-                        date_query["$gte"] = filters.published_after
-                    if filters.published_before:
-                        date_query["$lte"] = filters.published_before
-                    query["published_at"] = date_query
-
-            # Calculate pagination
-            skip = (page - 1) * per_page
-            
-            # Get total count
-            total = await self.collection.count_documents(query)
-            
-            # Get videos
-            cursor = self.collection.find(query).sort("published_at", DESCENDING).skip(skip).limit(per_page)
-            videos_data = await cursor.to_list(length=per_page)
+            query = _build_query(filters)
+            collation = _query_collation(filters)
             
-            videos = [VideoModel(**video_data) for video_data in videos_data]
+            async def load_page():
+                result = await self._query_page(query, collation, page, per_page, cursor, include_total, full)
+                return result.model_dump(by_alias=True, exclude_unset=True)
             
-            total_pages = (total + per_page - 1) // per_page
+            # The unfiltered first page is identical for every client; a cache
+            # hit is returned as stored, without rebuilding the models
+            if not query and not cursor and page == 1:
+                return await cache_through(
+                    "videos_first_page",
+                    {"per_page": per_page, "include_total": include_total, "full": full},
+                    load_page
+                )
             
-            return VideoResponse(
-                videos=videos,
-                total=total,
-                page=page,
-                per_page=per_page,
-                total_pages=total_pages
-            )
+            return await load_page()
             
         except Exception as e:
             logger.error(f"Error getting paginated videos: {e}")
             raise
 
-    async def get_latest_videos(self, limit: int = 10) -> List[VideoModel]:
-        """Get latest videos"""
-        self._ensure_connection()
+    async def _query_page(
+        self,
+        query: dict,
+        collation: Optional[dict],
+        page: int,
+        per_page: int,
+        cursor: Optional[VideoCursor],
+        include_total: bool,
+        full: bool
+    ) -> VideoResponse:
+        """Run a page query against the collection"""
+        # Get total count (opt-in, it is a full scan of the matching documents)
+        total = await self.collection.count_documents(query, collation=collation) if include_total else None
+
+        # Resume after the cursor position
+        page_query = query
+        if cursor:
+            after_cursor = {"$or": [
+                {"published_at": {"$lt": cursor.published_at}},
+                {"published_at": cursor.published_at, "_id": {"$lt": cursor.id}}
+            ]}
+            page_query = {"$and": [query, after_cursor]} if query else after_cursor
+
+        # Fetch one extra document to detect whether another page exists
+        projection = None if full else SUMMARY_PROJECTION
+        find_cursor = self.collection.find(page_query, projection, collation=collation).sort(
+            [("published_at", DESCENDING), ("_id", DESCENDING)]
+        )
+        if not cursor:
+            find_cursor = find_cursor.skip((page - 1) * per_page)
+        videos_data = await find_cursor.limit(per_page + 1).to_list(length=per_page + 1)
+        
+        has_more = len(videos_data) > per_page
+        videos_data = videos_data[:per_page]
+        videos = [VideoModel.from_document(video_data) for video_data in videos_data]
+        
+        next_cursor = None
+        if has_more:
+            last = videos_data[-1]
+            next_cursor = VideoCursor(published_at=last["published_at"], _id=last["_id"]).encode()
+        
+        total_pages = (total + per_page - 1) // per_page if total is not None else None
+        
+        return VideoResponse(
+            videos=videos,
+            page=page,
+            per_page=per_page,
+            next_cursor=next_cursor,
+            has_more=has_more,
+            total=total,
+            total_pages=total_pages
+        )
+
+    async def get_latest_videos(self, limit: int = 10, full: bool = False) -> List[dict]:
+        """
+        Get latest videos as JSON-ready dicts
+
+        Descriptions and the largest thumbnails are left out unless `full` is set.
+        """
         try:
-            cursor = self.collection.find().sort("published_at", DESCENDING).limit(limit)
-            videos_data = await cursor.to_list(length=limit)
-            return [VideoModel(**video_data) for video_data in videos_data]
+            async def find_latest(query):
+                projection = None if full else SUMMARY_PROJECTION
+                cursor = self.collection.find(query, projection).sort(
+                    [("published_at", DESCENDING), ("_id", DESCENDING)]
+                ).limit(limit)
+                return await cursor.to_list(length=limit)
+            
+            async def load_latest():
+                # Matching the partial index's filter lets the query use the smaller index
+                cutoff = get_recent_feed_cutoff()
+                videos_data = await find_latest({"published_at": {"$gt": cutoff}}) if cutoff else []
+                if len(videos_data) < limit:
+                    videos_data = await find_latest({})
+                return [
+                    VideoModel.from_document(video_data).model_dump(by_alias=True, exclude_unset=True)
+                    for video_data in videos_data
+                ]
+            
+            return await cache_through("latest_videos", {"limit": limit, "full": full}, load_latest)
         except Exception as e:
             logger.error(f"Error getting latest videos: {e}")
             raise
 
     async def delete_video(self, video_id: str) -> bool:
         """Delete video by YouTube video ID"""
-        self._ensure_connection()
         try:
             result = await self.collection.delete_one({"video_id": video_id})
             return result.deleted_count > 0
@@ -166,14 +305,43 @@ class VideoService:
             raise
 
     async def get_video_count(self) -> int:
-        """Get total video count"""
-        self._ensure_connection()
+        """Get total video count, estimated from collection metadata"""
         try:
-            return await self.collection.count_documents({})
+            return await self.collection.estimated_document_count()
         except Exception as e:
             logger.error(f"Error getting video count: {e}")
             raise
 
+    async def get_exact_video_count(self) -> Optional[int]:
+        """Get the exact video count last computed by the background fetcher, if cached"""
+        redis = get_redis()
+        if redis is None:
+            return None
+        
+        try:
+            count = await redis.get(EXACT_COUNT_KEY)
+            return int(count) if count is not None else None
+        except Exception as e:
+            logger.warning(f"Error reading exact video count: {e}")
+            return None
+
+    async def refresh_exact_video_count(self) -> int:
+        """Count every video and cache the result for get_exact_video_count"""
+        try:
+            count = await self.collection.count_documents({})
+        except Exception as e:
+            logger.error(f"Error refreshing exact video count: {e}")
+            raise
+        
+        redis = get_redis()
+        if redis is not None:
+            try:
+                await redis.set(EXACT_COUNT_KEY, count, ex=EXACT_COUNT_TTL)
+            except Exception as e:
+                logger.warning(f"Error caching exact video count: {e}")
+        
+        return count
+
 
 # Global video service instance
 video_service = VideoService()
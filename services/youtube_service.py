@@ -1,174 +1,619 @@
 import asyncio
+import functools
+import hashlib
+import heapq
 import logging
-from typing import List, Dict, Any, Optional
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import fields
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable, TypeVar
 from datetime import datetime, timedelta
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import httpx
+import ijson
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
+from diskcache import Cache
 from core.config import settings
+from models.video import VideoThumbnails, VideoRecord
 
 logger = logging.getLogger(__name__)
 
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+
+# Idle connections to the API are kept open this long (seconds) for reuse
+HTTP_KEEPALIVE_EXPIRY = 75
+
+# Request parameters shared by every call, built once
+SEARCH_PARAMS = {
+    'part': 'id',
+    'type': 'video',
+    'regionCode': 'US',
+    'relevanceLanguage': 'en'
+}
+VIDEO_DETAILS_PARTS = 'snippet,statistics,contentDetails'
+VIDEO_STATISTICS_PARTS = 'statistics'
+
+# Thumbnail sizes stored with each video
+THUMBNAIL_QUALITIES = frozenset(VideoThumbnails.model_fields)
+
+# Per-key request rate, matching the API's per-user limit of 100 requests per 100s
+KEY_RATE_LIMIT = 100
+KEY_RATE_PERIOD = 100
+
+# How long a key stays retired after exhausting its daily quota
+QUOTA_RESET_SECONDS = 24 * 60 * 60
+
+# Error reasons reported by the API and how each is handled: daily quota
+# retires the key until its reset, short-term rate limiting waits and retries
+# the same key, and an invalid key is dropped for good
+QUOTA_REASONS = {'quotaExceeded', 'dailyLimitExceeded'}
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+RATE_LIMIT_BACKOFF = 60
+RATE_LIMIT_RETRIES = 1
+INVALID_KEY_REASONS = {'keyInvalid', 'keyExpired'}
+
+# Search results are reused for identical searches within this window
+SEARCH_CACHE_SIZE = 1024
+SEARCH_CACHE_TTL = 15 * 60
+
+# Parsed video details are reused across searches (and restarts) for this long;
+# only the snippet and content details are taken from the cache, counts are
+# always requested again
+VIDEO_CACHE_TTL = 24 * 60 * 60
+
+# Cached videos are keyed under a digest of the VideoRecord schema, so entries
+# written before a field change are never read back (they simply expire)
+VIDEO_CACHE_VERSION = hashlib.blake2b(
+    ",".join(f"{field.name}:{field.type}" for field in fields(VideoRecord)).encode(),
+    digest_size=4
+).hexdigest()
+
+# ISO 8601 durations as returned by the API, e.g. PT1H2M3S or P1DT2H
+_DURATION_RE = re.compile(r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$")
+
+
+def _iso8601_to_seconds(duration: Optional[str]) -> Optional[int]:
+    """Convert an ISO 8601 video duration to seconds, or None if it cannot be parsed"""
+    if not duration:
+        return None
+    match = _DURATION_RE.match(duration)
+    if not match:
+        return None
+    days, hours, minutes, seconds = (int(part) if part else 0 for part in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+
+def _parse_video_counts(item: Dict[str, Any]) -> Dict[str, int]:
+    """Read the view, like and comment counts of a videos.list item"""
+    # Live streams and private videos can come back without statistics
+    statistics = item.get('statistics') or {}
+    return {
+        'view_count': int(statistics.get('viewCount') or 0),
+        'like_count': int(statistics.get('likeCount') or 0),
+        'comment_count': int(statistics.get('commentCount') or 0)
+    }
+
+
+def _parse_yt_ts(timestamp: str) -> datetime:
+    """Parse an API timestamp (always UTC, YYYY-MM-DDTHH:MM:SSZ) into a naive UTC datetime"""
+    return datetime(
+        int(timestamp[0:4]), int(timestamp[5:7]), int(timestamp[8:10]),
+        int(timestamp[11:13]), int(timestamp[14:16]), int(timestamp[17:19])
+    )
+
+
+class _StreamReader:
+    """Async file-like view of a streamed response body, as ijson reads it"""
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to check for bytes vs str
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+T = TypeVar("T")
+
+
+class YouTubeAPIError(Exception):
+    """Error response returned by the YouTube Data API"""
+
+    def __init__(self, status: int, reason: Optional[str], message: str):
+        self.status = status
+        self.reason = reason
+        self.message = message
+        super().__init__(f"YouTube API returned {status} ({reason}): {message}")
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "YouTubeAPIError":
+        """Build an error from an API response, tolerating non-JSON bodies"""
+        try:
+            error = response.json()["error"]
+            reason = (error.get("errors") or [{}])[0].get("reason")
+            return cls(response.status_code, reason, error.get("message", ""))
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return cls(response.status_code, None, response.text)
+
 
 class YouTubeAPIClient:
     def __init__(self):
-        self.api_keys = settings.get_api_keys()
-        self.current_key_index = 0
-        self.quota_reset_time = {}
+        self.api_keys = list(settings.api_keys)
+        # Reset times are time.monotonic() deadlines
+        self.quota_reset_time: Dict[str, float] = {}
         self.quota_exhausted = set()
+        # Usable keys, current one first, and (reset_time, key) for exhausted keys
+        self._available_keys = deque(self.api_keys)
+        self._reset_heap: List[Tuple[float, str]] = []
+        self._search_cache: TTLCache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        # Searches currently waiting on the API, shared by identical concurrent calls
+        self._inflight_searches: Dict[Tuple, asyncio.Task] = {}
+        self._uploads_playlists: Dict[str, str] = {}
+        self._http: Optional[httpx.AsyncClient] = None
+        self._video_cache: Optional[Cache] = None
+        self._video_cache_lock = threading.Lock()
+        # Cap outstanding API requests so bursts queue here instead of churning connections
+        self._request_semaphore = asyncio.Semaphore(settings.max_concurrent_api_requests)
+        self._key_limiters = {key: AsyncLimiter(KEY_RATE_LIMIT, KEY_RATE_PERIOD) for key in self.api_keys}
+        # Last characters of each key, the only part ever logged or reported
+        self._key_suffix = {key: key[-4:] for key in self.api_keys}
         
         if not self.api_keys:
             raise ValueError("No YouTube API keys provided")
         
-        logger.info(f"Initialized YouTube API client with {len(self.api_keys)} API keys")
+        logger.info("Initialized YouTube API client with %d API keys", len(self.api_keys))
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use"""
+        if self._http is None:
+            # Pool one connection per allowed concurrent request and keep them
+            # all alive, so steady fetching never pays for a new TLS handshake
+            limits = httpx.Limits(
+                max_connections=settings.max_concurrent_api_requests,
+                max_keepalive_connections=settings.max_concurrent_api_requests,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
+            self._http = httpx.AsyncClient(base_url=YOUTUBE_API_URL, timeout=10.0, limits=limits)
+        return self._http
+
+    def _get_video_cache(self) -> Cache:
+        """Get the on-disk video details cache, opening it on first use (blocking)"""
+        with self._video_cache_lock:
+            if self._video_cache is None:
+                self._video_cache = Cache(settings.video_cache_dir)
+            return self._video_cache
+
+    def _read_cached_videos(self, video_ids: List[str]) -> Dict[str, VideoRecord]:
+        """Look up videos in the on-disk cache (blocking, run in a thread)"""
+        video_cache = self._get_video_cache()
+        found = {}
+        for video_id in video_ids:
+            video_data = video_cache.get(f"{VIDEO_CACHE_VERSION}:{video_id}")
+            if video_data is not None:
+                found[video_id] = VideoRecord(**video_data)
+        return found
+
+    def _write_cached_videos(self, videos: List[VideoRecord]):
+        """Store videos in the on-disk cache in one transaction (blocking, run in a thread)"""
+        video_cache = self._get_video_cache()
+        with video_cache.transact():
+            for video_data in videos:
+                # Plain dicts keep entries readable regardless of how VideoRecord pickles
+                video_cache.set(
+                    f"{VIDEO_CACHE_VERSION}:{video_data.video_id}", video_data.asdict(), expire=VIDEO_CACHE_TTL
+                )
+
+    async def close(self):
+        """Close the HTTP client and its pooled connections, and the video cache"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._video_cache is not None:
+            self._video_cache.close()
+            self._video_cache = None
+
+    async def _api_get(self, resource: str, params: Dict[str, Any], api_key: str) -> Dict[str, Any]:
+        """Call a YouTube Data API list endpoint and return the decoded response"""
+        async with self._key_limiters[api_key], self._request_semaphore:
+            response = await self._get_http_client().get(f"/{resource}", params={**params, 'key': api_key})
+        if response.status_code != 200:
+            raise YouTubeAPIError.from_response(response)
+        return response.json()
+
+    async def _api_get_items(
+        self,
+        resource: str,
+        params: Dict[str, Any],
+        api_key: str,
+        parse: Callable[[Dict[str, Any]], T]
+    ) -> List[T]:
+        """
+        Call a list endpoint and parse its items one at a time as they stream in
+
+        Only one raw item is held in memory at once, rather than the whole
+        decoded response.
+        """
+        async with self._key_limiters[api_key], self._request_semaphore:
+            async with self._get_http_client().stream(
+                'GET', f"/{resource}", params={**params, 'key': api_key}
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise YouTubeAPIError.from_response(response)
+                return [parse(item) async for item in ijson.items(_StreamReader(response), 'items.item')]
+
+    @property
+    def current_key_index(self) -> int:
+        """Index of the key new requests are made with"""
+        return self.api_keys.index(self._available_keys[0]) if self._available_keys else 0
 
     def _get_next_available_key(self) -> Optional[str]:
         """Get the next available API key that hasn't exhausted its quota"""
-        now = datetime.utcnow()
+        now = time.monotonic()
         
-        # Reset quota for keys that have passed the reset time (24 hours)
-        for key in list(self.quota_exhausted):
-            if key in self.quota_reset_time:
-                if now >= self.quota_reset_time[key]:
-                    self.quota_exhausted.discard(key)
-                    del self.quota_reset_time[key]
-                    logger.info(f"Quota reset for API key ending in ...{key[-4:]}")
-        
-        # Find next available key
-        for i in range(len(self.api_keys)):
-            key_index = (self.current_key_index + i) % len(self.api_keys)
-            key = self.api_keys[key_index]
-            
-            if key not in self.quota_exhausted:
-                self.current_key_index = key_index
-                return key
+        # Reinstate keys that have passed their reset time (24 hours)
+        while self._reset_heap and self._reset_heap[0][0] <= now:
+            _, key = heapq.heappop(self._reset_heap)
+            self.quota_exhausted.discard(key)
+            self.quota_reset_time.pop(key, None)
+            self._available_keys.append(key)
+            logger.info("Quota reset for API key ending in ...%s", self._key_suffix[key])
         
-        return None
+        return self._available_keys[0] if self._available_keys else None
 
     def _mark_key_exhausted(self, api_key: str):
         """Mark an API key as quota exhausted"""
+        # Concurrent searches on the same key can all hit the quota error
+        if api_key in self.quota_exhausted:
+            return
+        
+        if self._available_keys[0] == api_key:
+            self._available_keys.popleft()
+        else:
+            self._available_keys.remove(api_key)
+        
         self.quota_exhausted.add(api_key)
         # Set reset time to 24 hours from now
-        self.quota_reset_time[api_key] = datetime.utcnow() + timedelta(hours=24)
-        logger.warning(f"API key ending in ...{api_key[-4:]} quota exhausted")
+        reset_time = time.monotonic() + QUOTA_RESET_SECONDS
+        self.quota_reset_time[api_key] = reset_time
+        heapq.heappush(self._reset_heap, (reset_time, api_key))
+        logger.warning("API key ending in ...%s quota exhausted", self._key_suffix[api_key])
+
+    def _remove_key(self, api_key: str):
+        """Stop using an API key the API rejected as invalid"""
+        if api_key not in self.api_keys:
+            return
+        
+        self.api_keys.remove(api_key)
+        if api_key in self._available_keys:
+            self._available_keys.remove(api_key)
+        logger.error("API key ending in ...%s is invalid and has been removed", self._key_suffix[api_key])
 
     async def search_videos(
         self,
         query: str,
         max_results: int = 50,
         published_after: Optional[datetime] = None,
-        order: str = "date"
-    ) -> List[Dict[str, Any]]:
-        """Search for videos using YouTube Data API v3"""
-        api_key = self._get_next_available_key()
-        if not api_key:
-            raise Exception("All API keys have exhausted their quota")
+        order: str = "date",
+        use_cache: bool = True
+    ) -> List[VideoRecord]:
+        """
+        Search for videos using YouTube Data API v3
+
+        Results are cached in memory for SEARCH_CACHE_TTL seconds, and identical
+        searches made while one is in flight wait for it, so repeating a search
+        does not spend API quota again. Callers that need fresh results, or whose
+        `published_after` moves on every call so the search never repeats, pass
+        `use_cache=False` to go straight to the API.
+        """
+        if not use_cache:
+            return await self._search_videos(query, max_results, published_after, order)
         
-        try:
-            # Build YouTube service
-            youtube = build('youtube', 'v3', developerKey=api_key)
-            
-            # Prepare search parameters
-            search_params = {
-                'part': 'id,snippet',
-                'q': query,
-                'type': 'video',
-                'order': order,
-                'maxResults': min(max_results, 50),  # API limit is 50
-                'regionCode': 'US',
-                'relevanceLanguage': 'en'
-            }
-            
-            if published_after:
-                search_params['publishedAfter'] = published_after.isoformat() + 'Z'
-            
-            # Execute search
-            search_response = youtube.search().list(**search_params).execute()
-            
-            video_ids = [item['id']['videoId'] for item in search_response['items']]
-            
-            if not video_ids:
-                return []
-            
-            # Get detailed video information
-            videos_response = youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=','.join(video_ids)
-            ).execute()
-            
-            videos = []
-            for item in videos_response['items']:
-                video_data = self._parse_video_data(item)
-                videos.append(video_data)
-            
-            logger.info(f"Successfully fetched {len(videos)} videos using API key ending in ...{api_key[-4:]}")
-            return videos
+        cache_key = ("search", query, max_results, published_after.isoformat() if published_after else None, order)
+        return await self._fetch_shared(
+            cache_key, lambda: self._search_videos(query, max_results, published_after, order)
+        )
+
+    async def _fetch_shared(
+        self,
+        cache_key: Tuple,
+        fetch: Callable[[], Awaitable[List[VideoRecord]]]
+    ) -> List[VideoRecord]:
+        """Serve a listing from the in-memory cache, or share one fetch between identical callers"""
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        task = self._inflight_searches.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight_searches[cache_key] = task
+            task.add_done_callback(lambda done: self._on_search_done(cache_key, done))
+        
+        # Shield so one caller being cancelled does not cancel the shared fetch
+        videos = await asyncio.shield(task)
+        return list(videos)
+
+    def _on_search_done(self, cache_key: Tuple, task: asyncio.Task):
+        """Cache a finished listing and stop sharing it"""
+        self._inflight_searches.pop(cache_key, None)
+        if not task.cancelled() and task.exception() is None:
+            self._search_cache[cache_key] = task.result()
+
+    async def _search_videos(
+        self,
+        query: str,
+        max_results: int,
+        published_after: Optional[datetime],
+        order: str
+    ) -> List[VideoRecord]:
+        """Run a search against the API, rotating keys on quota exhaustion"""
+        # Prepare search parameters
+        search_params = {**SEARCH_PARAMS, 'q': query, 'order': order}
+        
+        if published_after:
+            search_params['publishedAfter'] = published_after.isoformat() + 'Z'
+        
+        return await self._with_key_rotation(
+            lambda api_key: self._collect_videos(
+                lambda page_size, page_token: self._search_ids(search_params, page_size, page_token, api_key),
+                max_results,
+                api_key
+            )
+        )
+
+    async def _with_key_rotation(self, call: Callable[[str], Awaitable[T]]) -> T:
+        """Run an API call with the current key, moving on to the next key on quota errors"""
+        # Every failed attempt retires a key, except the rate-limit retries
+        rate_limit_retries = RATE_LIMIT_RETRIES
+        for _ in range(len(self.api_keys) + RATE_LIMIT_RETRIES):
+            api_key = self._get_next_available_key()
+            if not api_key:
+                break
             
-        except HttpError as e:
-            if e.resp.status == 403 and 'quota' in str(e).lower():
-                self._mark_key_exhausted(api_key)
-                # Try with next available key
-                return await self.search_videos(query, max_results, published_after, order)
-            else:
-                logger.error(f"YouTube API error: {e}")
+            try:
+                return await call(api_key)
+                
+            except YouTubeAPIError as e:
+                if e.reason in RATE_LIMIT_REASONS and rate_limit_retries > 0:
+                    rate_limit_retries -= 1
+                    logger.warning(
+                        "API key ending in ...%s rate limited, retrying in %ds",
+                        self._key_suffix[api_key], RATE_LIMIT_BACKOFF
+                    )
+                    await asyncio.sleep(RATE_LIMIT_BACKOFF)
+                elif e.reason in QUOTA_REASONS:
+                    # Try with next available key
+                    self._mark_key_exhausted(api_key)
+                elif e.reason in INVALID_KEY_REASONS:
+                    self._remove_key(api_key)
+                else:
+                    logger.error("YouTube API error: %s", e)
+                    raise
+            except Exception as e:
+                logger.error("Error fetching videos: %s", e)
                 raise
-        except Exception as e:
-            logger.error(f"Error searching videos: {e}")
-            raise
+        
+        raise Exception("All API keys have exhausted their quota")
+
+    async def _collect_videos(
+        self,
+        fetch_ids: Callable[[int, Optional[str]], Awaitable[Tuple[List[str], Optional[str]]]],
+        max_results: int,
+        api_key: str
+    ) -> List[VideoRecord]:
+        """
+        Collect up to max_results videos from a paged listing of video IDs
+
+        `fetch_ids(page_size, page_token)` returns one page of IDs and the token
+        of the next page, or None once the listing is done.
+        """
+        # Pages come back one at a time (each needs the previous page's token),
+        # so fetch details for each page while requesting the next. Detail
+        # lookups need the IDs a listing returns, which is also why the two
+        # calls cannot share one batch (multipart) request.
+        detail_tasks = []
+        found = 0
+        page_token = None
+        try:
+            while found < max_results:
+                # A failed detail fetch fails the whole attempt, so stop before
+                # spending quota on another page of IDs
+                for task in detail_tasks:
+                    if task.done() and task.exception() is not None:
+                        raise task.exception()
+                
+                video_ids, page_token = await fetch_ids(min(max_results - found, 50), page_token)
+                if video_ids:
+                    found += len(video_ids)
+                    detail_tasks.append(asyncio.create_task(self._fetch_details(video_ids, api_key)))
+                if not page_token:
+                    break
+            
+            pages = await asyncio.gather(*detail_tasks)
+        finally:
+            for task in detail_tasks:
+                task.cancel()
+            # Retrieve every outcome so failed tasks are not reported as unhandled
+            await asyncio.gather(*detail_tasks, return_exceptions=True)
+        
+        videos = [video for page in pages for video in page]
+        
+        logger.info(
+            "Successfully fetched %d videos using API key ending in ...%s", len(videos), self._key_suffix[api_key]
+        )
+        return videos
+
+    async def _search_ids(
+        self,
+        search_params: Dict[str, Any],
+        max_results: int,
+        page_token: Optional[str],
+        api_key: str
+    ) -> Tuple[List[str], Optional[str]]:
+        """Fetch one page of search results, returning its video IDs and the next page token"""
+        params = {**search_params, 'maxResults': max_results}
+        if page_token:
+            params['pageToken'] = page_token
+        
+        search_response = await self._api_get('search', params, api_key)
+        video_ids = [item['id']['videoId'] for item in search_response['items']]
+        return video_ids, search_response.get('nextPageToken')
+
+    async def _playlist_ids(
+        self,
+        playlist_id: str,
+        published_after: Optional[datetime],
+        max_results: int,
+        page_token: Optional[str],
+        api_key: str
+    ) -> Tuple[List[str], Optional[str]]:
+        """Fetch one page of a playlist, returning its video IDs and the next page token"""
+        params = {'part': 'contentDetails', 'playlistId': playlist_id, 'maxResults': max_results}
+        if page_token:
+            params['pageToken'] = page_token
+        
+        playlist_response = await self._api_get('playlistItems', params, api_key)
+        video_ids = []
+        for item in playlist_response['items']:
+            details = item['contentDetails']
+            published = details.get('videoPublishedAt')
+            # Uploads are listed newest first, so the first older video ends the listing
+            if published_after and published and _parse_yt_ts(published) < published_after:
+                return video_ids, None
+            video_ids.append(details['videoId'])
+        return video_ids, playlist_response.get('nextPageToken')
+
+    async def _get_uploads_playlist(self, channel_id: str, api_key: str) -> Optional[str]:
+        """Look up the ID of a channel's uploads playlist, or None if the channel does not exist"""
+        playlist_id = self._uploads_playlists.get(channel_id)
+        if playlist_id is None:
+            channels_response = await self._api_get('channels', {'part': 'contentDetails', 'id': channel_id}, api_key)
+            if not channels_response.get('items'):
+                return None
+            playlist_id = channels_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
+            # A channel's uploads playlist never changes
+            self._uploads_playlists[channel_id] = playlist_id
+        return playlist_id
+
+    async def _fetch_details(self, video_ids: List[str], api_key: str) -> List[VideoRecord]:
+        """
+        Fetch and parse details for up to 50 videos (the videos.list limit)
+
+        Counts change constantly, so every call requests statistics for all
+        IDs. When all of them were fetched within VIDEO_CACHE_TTL, the rest of
+        each video comes from the on-disk cache and only statistics are
+        downloaded; otherwise the full details are requested in the same call.
+        """
+        # diskcache is synchronous SQLite, so keep it off the event loop
+        cached = await asyncio.to_thread(self._read_cached_videos, video_ids)
+        params = {'id': ','.join(video_ids)}
+        
+        if len(cached) == len(video_ids):
+            counts = await self._api_get_items(
+                'videos', {**params, 'part': VIDEO_STATISTICS_PARTS}, api_key,
+                lambda item: (item['id'], _parse_video_counts(item))
+            )
+            found = {}
+            for video_id, video_counts in counts:
+                video_data = cached[video_id]
+                video_data.view_count = video_counts['view_count']
+                video_data.like_count = video_counts['like_count']
+                video_data.comment_count = video_counts['comment_count']
+                found[video_id] = video_data
+        else:
+            # videos.list costs the same quota whatever the parts, so fetch
+            # everything for all IDs rather than making a second call
+            videos = await self._api_get_items(
+                'videos', {**params, 'part': VIDEO_DETAILS_PARTS}, api_key, self._parse_video_data
+            )
+            await asyncio.to_thread(
+                self._write_cached_videos, [video_data for video_data in videos if video_data.video_id not in cached]
+            )
+            found = {video_data.video_id: video_data for video_data in videos}
+        
+        # Keep the search's order; IDs the API did not return are dropped
+        return [found[video_id] for video_id in video_ids if video_id in found]
 
-    def _parse_video_data(self, item: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_video_data(self, item: Dict[str, Any]) -> VideoRecord:
         """Parse video data from YouTube API response"""
         snippet = item['snippet']
-        statistics = item.get('statistics', {})
-        content_details = item.get('contentDetails', {})
+        duration = item.get('contentDetails', {}).get('duration')
         
         # Parse thumbnails
-        thumbnails = {}
-        for quality, thumbnail in snippet.get('thumbnails', {}).items():
-            thumbnails[quality] = {
+        thumbnails = {
+            quality: {
                 'url': thumbnail['url'],
                 'width': thumbnail.get('width', 0),
                 'height': thumbnail.get('height', 0)
             }
-        
-        # Parse published date
-        published_at = datetime.fromisoformat(
-            snippet['publishedAt'].replace('Z', '+00:00')
-        ).replace(tzinfo=None)
-        
-        return {
-            'video_id': item['id'],
-            'title': snippet['title'],
-            'description': snippet['description'],
-            'published_at': published_at,
-            'channel_id': snippet['channelId'],
-            'channel_title': snippet['channelTitle'],
-            'thumbnails': thumbnails,
-            'duration': content_details.get('duration'),
-            'view_count': int(statistics.get('viewCount', 0)),
-            'like_count': int(statistics.get('likeCount', 0)),
-            'comment_count': int(statistics.get('commentCount', 0)),
-            'tags': snippet.get('tags', []),
-            'category_id': snippet.get('categoryId'),
-            'language': snippet.get('defaultLanguage')
+            for quality, thumbnail in snippet.get('thumbnails', {}).items()
+            if quality in THUMBNAIL_QUALITIES
         }
+        
+        return VideoRecord(
+            video_id=item['id'],
+            title=snippet['title'],
+            description=snippet['description'],
+            published_at=_parse_yt_ts(snippet['publishedAt']),
+            channel_id=snippet['channelId'],
+            channel_title=snippet['channelTitle'],
+            thumbnails=thumbnails,
+            duration=duration,
+            duration_seconds=_iso8601_to_seconds(duration),
+            **_parse_video_counts(item),
+            tags=snippet.get('tags', []),
+            category_id=snippet.get('categoryId'),
+            language=snippet.get('defaultLanguage')
+        )
 
     async def get_channel_videos(
         self,
         channel_id: str,
         max_results: int = 50,
         published_after: Optional[datetime] = None
-    ) -> List[Dict[str, Any]]:
-        """Get videos from a specific channel"""
-        return await self.search_videos(
-            query=f"channel:{channel_id}",
-            max_results=max_results,
-            published_after=published_after,
-            order="date"
+    ) -> List[VideoRecord]:
+        """
+        Get videos from a specific channel, newest first
+
+        Reads the channel's uploads playlist rather than searching for it: a
+        playlistItems.list page costs 1 quota unit, search.list costs 100.
+        Results are cached and shared between identical calls like searches.
+        """
+        cache_key = ("channel", channel_id, max_results, published_after.isoformat() if published_after else None)
+        return await self._fetch_shared(
+            cache_key, lambda: self._get_channel_videos(channel_id, max_results, published_after)
         )
 
+    async def _get_channel_videos(
+        self,
+        channel_id: str,
+        max_results: int,
+        published_after: Optional[datetime]
+    ) -> List[VideoRecord]:
+        """List a channel's uploads against the API, rotating keys on quota exhaustion"""
+        async def fetch_channel_videos(api_key: str) -> List[VideoRecord]:
+            playlist_id = await self._get_uploads_playlist(channel_id, api_key)
+            if not playlist_id:
+                return []
+            return await self._collect_videos(
+                lambda page_size, page_token: self._playlist_ids(
+                    playlist_id, published_after, page_size, page_token, api_key
+                ),
+                max_results,
+                api_key
+            )
+        
+        return await self._with_key_rotation(fetch_channel_videos)
+
     def get_quota_status(self) -> Dict[str, Any]:
         """Get current quota status for all API keys"""
         now = datetime.utcnow()
+        monotonic_now = time.monotonic()
         status = {
             'total_keys': len(self.api_keys),
             'available_keys': len(self.api_keys) - len(self.quota_exhausted),
@@ -180,19 +625,28 @@ class YouTubeAPIClient:
         for i, key in enumerate(self.api_keys):
             key_status = {
                 'index': i,
-                'key_suffix': key[-4:],
+                'key_suffix': self._key_suffix[key],
                 'is_exhausted': key in self.quota_exhausted,
                 'reset_time': None
             }
             
             if key in self.quota_reset_time:
-                key_status['reset_time'] = self.quota_reset_time[key].isoformat()
+                remaining = self.quota_reset_time[key] - monotonic_now
+                key_status['reset_time'] = (now + timedelta(seconds=remaining)).isoformat()
             
             status['keys_status'].append(key_status)
         
         return status
 
 
-# Global YouTube API client instance
-youtube_client = YouTubeAPIClient()
+@functools.cache
+def get_youtube_client() -> YouTubeAPIClient:
+    """Get the shared YouTube API client, creating it on first use"""
+    return YouTubeAPIClient()
+
+
+async def close_youtube_client():
+    """Close the shared YouTube API client, if it was ever created"""
+    if get_youtube_client.cache_info().currsize:
+        await get_youtube_client().close()
 